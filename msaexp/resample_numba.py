@@ -1,6 +1,7 @@
 import numpy as np
-from numba import jit
-from math import erf, pow as _pow
+from numba import jit, prange, vectorize, types, float32, float64
+from numba.extending import overload
+from math import erf
 
 __all__ = [
     "simpson",
@@ -8,6 +9,7 @@ __all__ = [
     "trapz_dx",
     "resample_template_numba",
     "sample_gaussian_line_numba",
+    "sample_gaussian_lines_numba",
     "pixel_integrated_gaussian_numba",
     "compute_igm",
     "calzetti2000_alambda",
@@ -20,6 +22,10 @@ __all__ = [
 
 CLIGHT = 299792458.0  # m/s
 
+SQRT2 = np.sqrt(2.0)
+
+INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
 
 @jit(nopython=True, fastmath=True, error_model="numpy")
 def simpson(y, x):
@@ -140,7 +146,14 @@ def trapz(y, x):
     return result
 
 
-@jit(nopython=True, fastmath=True, error_model="numpy")
+# Number of spectrum pixels processed together in the multithreaded
+# resampling kernel, read at runtime by `resample_template_numba`
+RESAMPLE_CHUNK_SIZE = 256
+
+# Spectrum size above which the multithreaded resampling kernel is used
+RESAMPLE_PARALLEL_THRESHOLD = 4096
+
+
 def resample_template_numba(
     spec_wobs,
     spec_R_fwhm,
@@ -153,6 +166,7 @@ def resample_template_numba(
     wave_max=1.0e6,
     left=0.0,
     right=0.0,
+    parallel=None,
 ):
     """
     Resample a high resolution template/model on the wavelength grid of a
@@ -191,35 +205,145 @@ def resample_template_numba(
     left, right : float
         Fill values when wavelengths less (greater) than wave_min (wave_max)
 
+    parallel : bool, None
+        Use the multithreaded version of the resampling kernel.  If None, use
+        it when ``len(spec_wobs) >= RESAMPLE_PARALLEL_THRESHOLD``
+
     Returns
     -------
     resamp : array-like
         Template resampled at the `spec_wobs` wavelengths, convolved with a
-        Gaussian kernel with sigma width
+        Gaussian kernel with sigma width.  Single precision if both
+        ``spec_wobs`` and ``templ_flux`` are ``float32``, otherwise double
+        precision.
 
         >>> Rw = 1./np.sqrt((velocity_sigma/3.e5)**2 + 1./(spec_R_fwhm*2.35)**2)
         >>> dw = spec_wobs / Rw
 
     """
-    dw = (
-        np.sqrt(
-            (velocity_sigma / 3.0e5) ** 2 + (1.0 / 2.35 / spec_R_fwhm) ** 2
-        )
-        * spec_wobs
+    if parallel is None:
+        parallel = len(spec_wobs) >= RESAMPLE_PARALLEL_THRESHOLD
+
+    args = (
+        spec_wobs,
+        spec_R_fwhm,
+        templ_wobs,
+        templ_flux,
+        velocity_sigma,
+        nsig,
+        fill_value,
+        wave_min,
+        wave_max,
+        left,
+        right,
     )
 
-    # Rw = 1./np.sqrt((velocity_sigma/3.e5)**2 + 1./(spec_R_fwhm*2.35)**2)
-    # dw = spec_wobs / Rw
+    if parallel:
+        # Chunk size passed as an argument so that it can be changed at
+        # runtime rather than being frozen into the compiled kernel
+        resamp = _resample_template_parallel(*args, RESAMPLE_CHUNK_SIZE)
+    else:
+        resamp = _resample_template_serial(*args)
 
-    ilo = 0
-    ihi = 1
+    return resamp
 
-    N = len(spec_wobs)
-    resamp = np.ones_like(spec_wobs) * fill_value
 
+def _resample_output(spec_wobs, templ_flux):
+    """
+    Empty output array of `resample_template_numba`, which is single precision
+    if both ``spec_wobs`` and ``templ_flux`` are ``float32`` and double
+    precision otherwise.  Specialized at compile time in jitted functions with
+    the overload below.
+    """
+    if (spec_wobs.dtype == np.float32) & (templ_flux.dtype == np.float32):
+        return np.empty(spec_wobs.shape, dtype=np.float32)
+    else:
+        return np.empty(spec_wobs.shape, dtype=np.float64)
+
+
+@overload(_resample_output)
+def _resample_output_overload(spec_wobs, templ_flux):
+    if (spec_wobs.dtype == types.float32) & (
+        templ_flux.dtype == types.float32
+    ):
+        return lambda spec_wobs, templ_flux: np.empty(
+            spec_wobs.shape, dtype=np.float32
+        )
+    else:
+        return lambda spec_wobs, templ_flux: np.empty(
+            spec_wobs.shape, dtype=np.float64
+        )
+
+
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
+def _resample_kernel_terms(spec_wobs, spec_R_fwhm, velocity_sigma, resamp):
+    """
+    Width of the Gaussian kernel of `resample_template_numba` and the kernel
+    terms computed once rather than for every template sample, with the same
+    dtype as the output array ``resamp``
+
+    Returns
+    -------
+    dw, inv_two_sigma2, inv_norm : array-like
+        Kernel sigma, ``0.5 / dw**2`` and ``1 / sqrt(2 pi) / dw``
+
+    """
+    dw = np.empty_like(resamp)
+    inv_two_sigma2 = np.empty_like(resamp)
+    inv_norm = np.empty_like(resamp)
+
+    vel2 = (velocity_sigma / 3.0e5) ** 2
+
+    for i in range(len(spec_wobs)):
+        dw_i = (
+            np.sqrt(vel2 + (1.0 / 2.35 / spec_R_fwhm[i]) ** 2) * spec_wobs[i]
+        )
+
+        # Rw = 1./np.sqrt((velocity_sigma/3.e5)**2 + 1./(spec_R_fwhm*2.35)**2)
+        # dw = spec_wobs / Rw
+
+        # Reciprocal guarded against dw = 0, e.g., for velocity_sigma = 0 and
+        # infinite R, where the kernel falls between two template samples
+        # and takes the nearer of them
+        inv_dw = 1.0 / max(dw_i, 1.0e-30)
+
+        dw[i] = dw_i
+        inv_two_sigma2[i] = 0.5 * inv_dw * inv_dw
+        inv_norm[i] = inv_dw * INV_SQRT_2PI
+
+    return dw, inv_two_sigma2, inv_norm
+
+
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
+def _resample_template_chunk(
+    spec_wobs,
+    dw,
+    inv_two_sigma2,
+    inv_norm,
+    templ_wobs,
+    templ_flux,
+    nsig,
+    wave_min,
+    wave_max,
+    left,
+    right,
+    i0,
+    i1,
+    resamp,
+):
+    """
+    Resample the spectrum pixels ``i0:i1`` into ``resamp``.  See
+    `resample_template_numba`.
+    """
     Nt = len(templ_wobs)
 
-    for i in range(N):
+    # Sliding window on the template, where ilo (ihi) is the first template
+    # sample at or above the lower (upper) edge of the kernel.  Both only
+    # move forward as long as the kernel edges increase with spec_wobs
+    ilo = np.searchsorted(templ_wobs, spec_wobs[i0] - nsig * dw[i0])
+    ihi = np.searchsorted(templ_wobs, spec_wobs[i0] + nsig * dw[i0])
+
+    for i in range(i0, i1):
         if spec_wobs[i] < wave_min:
             resamp[i] = left
             continue
@@ -227,38 +351,170 @@ def resample_template_numba(
             resamp[i] = right
             continue
 
-        ilo_i = ilo
-        while (templ_wobs[ilo] < spec_wobs[i] - nsig * dw[i]) & (ilo < Nt - 1):
+        lo_i = spec_wobs[i] - nsig * dw[i]
+        hi_i = spec_wobs[i] + nsig * dw[i]
+
+        while (ilo < Nt) and (templ_wobs[ilo] < lo_i):
             ilo += 1
 
-        if ilo == 0:
-            continue
+        while (ihi < Nt) and (templ_wobs[ihi] < hi_i):
+            ihi += 1
 
-        # did we take a step?
-        if ilo > ilo_i:
+        # Step back if the kernel edge decreased, e.g., with a jump in R
+        while (ilo > 0) and (templ_wobs[ilo - 1] >= lo_i):
             ilo -= 1
 
-        while (templ_wobs[ihi] < spec_wobs[i] + nsig * dw[i]) & (ihi < Nt):
-            ihi += 1
+        while (ihi > 0) and (templ_wobs[ihi - 1] >= hi_i):
+            ihi -= 1
 
-        if ilo >= ihi:
-            resamp[i] = templ_flux[ihi]
+        if ilo == ihi:
+            # Kernel falls between two template samples, take the nearer
+            if (ihi > 0) & (ihi < Nt):
+                if (spec_wobs[i] - templ_wobs[ihi - 1]) < (
+                    templ_wobs[ihi] - spec_wobs[i]
+                ):
+                    resamp[i] = templ_flux[ihi - 1]
+                else:
+                    resamp[i] = templ_flux[ihi]
             continue
-        elif ilo == Nt - 1:
-            break
 
-        sl = slice(ilo, ihi)
-        lsl = templ_wobs[sl]
-        g = np.exp(-((lsl - spec_wobs[i]) ** 2) / 2 / dw[i] ** 2) / np.sqrt(
-            2 * np.pi * dw[i] ** 2
+        # Include the samples bracketing the kernel edges
+        jlo = max(ilo - 1, 0)
+        jhi = min(ihi + 1, Nt)
+
+        # Trapezoid rule integration of templ_flux * g fused with the
+        # evaluation of the Gaussian kernel g over templ_wobs[jlo:jhi],
+        # carrying the previous sample in scalars
+        wi = spec_wobs[i]
+        inv_two_sigma2_i = inv_two_sigma2[i]
+        inv_norm_i = inv_norm[i]
+
+        w_prev = templ_wobs[jlo]
+        d = w_prev - wi
+        f_prev = (
+            templ_flux[jlo] * np.exp(-d * d * inv_two_sigma2_i) * inv_norm_i
+        )
+        acc = 0.0
+        for j in range(jlo + 1, jhi):
+            w_cur = templ_wobs[j]
+            d = w_cur - wi
+            f_cur = (
+                templ_flux[j] * np.exp(-d * d * inv_two_sigma2_i) * inv_norm_i
+            )
+            acc += 0.5 * (f_prev + f_cur) * (w_cur - w_prev)
+            f_prev = f_cur
+            w_prev = w_cur
+
+        resamp[i] = acc
+
+
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
+def _resample_template_serial(
+    spec_wobs,
+    spec_R_fwhm,
+    templ_wobs,
+    templ_flux,
+    velocity_sigma,
+    nsig,
+    fill_value,
+    wave_min,
+    wave_max,
+    left,
+    right,
+):
+    """
+    Serial resampling kernel of `resample_template_numba`
+    """
+    resamp = _resample_output(spec_wobs, templ_flux)
+    resamp[:] = fill_value
+
+    dw, inv_two_sigma2, inv_norm = _resample_kernel_terms(
+        spec_wobs, spec_R_fwhm, velocity_sigma, resamp
+    )
+
+    N = len(spec_wobs)
+
+    if N > 0:
+        _resample_template_chunk(
+            spec_wobs,
+            dw,
+            inv_two_sigma2,
+            inv_norm,
+            templ_wobs,
+            templ_flux,
+            nsig,
+            wave_min,
+            wave_max,
+            left,
+            right,
+            0,
+            N,
+            resamp,
         )
-        # g *= 1./np.sqrt(2*np.pi*dw[i]**2)
-        resamp[i] = trapz(templ_flux[sl] * g, lsl)
 
     return resamp
 
 
-@jit(nopython=True, fastmath=True, error_model="numpy")
+@jit(
+    nopython=True,
+    parallel=True,
+    fastmath=True,
+    error_model="numpy",
+    cache=True,
+)
+def _resample_template_parallel(
+    spec_wobs,
+    spec_R_fwhm,
+    templ_wobs,
+    templ_flux,
+    velocity_sigma,
+    nsig,
+    fill_value,
+    wave_min,
+    wave_max,
+    left,
+    right,
+    chunk_size,
+):
+    """
+    Multithreaded resampling kernel of `resample_template_numba`, where the
+    spectrum is processed in independent chunks of ``chunk_size`` pixels
+    """
+    resamp = _resample_output(spec_wobs, templ_flux)
+    resamp[:] = fill_value
+
+    dw, inv_two_sigma2, inv_norm = _resample_kernel_terms(
+        spec_wobs, spec_R_fwhm, velocity_sigma, resamp
+    )
+
+    N = len(spec_wobs)
+
+    nchunk = (N + chunk_size - 1) // chunk_size
+
+    for k in prange(nchunk):
+        i0 = k * chunk_size
+        i1 = min(i0 + chunk_size, N)
+        _resample_template_chunk(
+            spec_wobs,
+            dw,
+            inv_two_sigma2,
+            inv_norm,
+            templ_wobs,
+            templ_flux,
+            nsig,
+            wave_min,
+            wave_max,
+            left,
+            right,
+            i0,
+            i1,
+            resamp,
+        )
+
+    return resamp
+
+
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
 def sample_gaussian_line_numba(
     spec_wobs,
     spec_R_fwhm,
@@ -307,7 +563,307 @@ def sample_gaussian_line_numba(
     return resamp
 
 
-@jit(nopython=True, fastmath=True, error_model="numpy")
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
+def sample_gaussian_lines_numba(
+    spec_wobs,
+    spec_R_fwhm,
+    lines_um,
+    line_flux,
+    velocity_sigma=100,
+):
+    """
+    Sum of Gaussian emission lines sampled on the spectrum wavelength grid
+    accounting for pixel integration, same as calling
+    `sample_gaussian_line_numba` for each line but with the resolution
+    interpolation and pixel widths computed once for all of them
+
+    Parameters
+    ----------
+    spec_wobs : array-like
+        Spectrum wavelengths
+
+    spec_R_fwhm : array-like
+        Spectral resolution `wave/d(wave)`, FWHM
+
+    lines_um : array-like
+        Emission line central wavelengths, in microns
+
+    line_flux : array-like
+        Normalization of each line
+
+    velocity_sigma : float
+        Kinematic velocity width, km/s
+
+    Returns
+    -------
+    resamp : array-like
+        Emission line "template" resampled at the `spec_wobs` wavelengths
+
+    """
+    Rw = np.interp(lines_um, spec_wobs, spec_R_fwhm)
+    dw = (
+        np.sqrt((velocity_sigma / 3.0e5) ** 2 + (1.0 / 2.35 / Rw) ** 2)
+        * lines_um
+    )
+
+    xdx = _pixel_gradient(spec_wobs)
+    resamp = np.zeros_like(xdx)
+
+    for k in range(len(lines_um)):
+        _add_pixel_integrated_gaussian_edges(
+            spec_wobs, xdx, lines_um[k], dw[k], line_flux[k], resamp
+        )
+
+    return resamp
+
+
+# |x| beyond which erf(x) rounds to +/-1 in double precision,
+# erfc(6) = 2.2e-17
+ERF_SATURATE = 6.0
+
+
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
+def _erf_wings(x):
+    """
+    Error function that returns +/-1 without calling ``math.erf`` in the far
+    wings, where it is saturated, which skips most of the work for narrow
+    profiles on wide grids
+
+    Parameters
+    ----------
+    x : float
+        Argument of the error function
+
+    Returns
+    -------
+    y : float
+        ``erf(x)``
+
+    """
+    if np.abs(x) > ERF_SATURATE:
+        return np.copysign(1.0, x)
+    else:
+        return erf(x)
+
+
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
+def _pixel_gradient(x):
+    """
+    Pixel widths of the samples ``x``, like ``np.gradient(x)``
+    (see https://github.com/numba/numba/issues/6302)
+
+    Parameters
+    ----------
+    x : array-like
+        Sample centers
+
+    Returns
+    -------
+    xdx : array-like
+        Pixel widths
+
+    """
+    xdx = np.empty_like(x)
+    xdx[1:-1] = (x[2:] - x[:-2]) / 2.0
+    xdx[0] = x[1] - x[0]
+    xdx[-1] = x[-1] - x[-2]
+    return xdx
+
+
+def _pixel_widths(x, dx):
+    """
+    Pixel widths ``dx`` if specified, otherwise computed from the sample
+    centers ``x`` with `_pixel_gradient`.  Specialized at compile time in
+    jitted functions with the overload below.
+    """
+    if dx is None:
+        return _pixel_gradient(x)
+    else:
+        return dx
+
+
+@overload(_pixel_widths)
+def _pixel_widths_overload(x, dx):
+    if isinstance(dx, (types.NoneType, types.Omitted)):
+        return lambda x, dx: _pixel_gradient(x)
+    else:
+        return lambda x, dx: dx
+
+
+def _cast_like(value, x):
+    """
+    Cast the scalar ``value`` to the dtype of a ``float32`` array ``x`` so that
+    ufuncs select their single precision loop.  Arrays and values for other
+    dtypes are passed through.  Specialized at compile time in jitted
+    functions with the overload below.
+    """
+    if np.isscalar(value) & (x.dtype == np.float32):
+        return np.float32(value)
+    else:
+        return value
+
+
+@overload(_cast_like)
+def _cast_like_overload(value, x):
+    if isinstance(value, types.Number) and (x.dtype == types.float32):
+        return lambda value, x: np.float32(value)
+    else:
+        return lambda value, x: value
+
+
+@vectorize(
+    [
+        float32(float32, float32, float32, float32, float32),
+        float64(float64, float64, float64, float64, float64),
+    ],
+    target="cpu",
+    fastmath=True,
+    cache=True,
+)
+def _pixel_integrated_gaussian_kernel(x, xdx, mu, sigma, normalization):
+    """
+    Pixel-integrated gaussian evaluated as a ufunc, which broadcasts scalar
+    and array arguments.  See `pixel_integrated_gaussian_numba`.  The
+    ``float32`` loop still evaluates the error functions in double precision,
+    since their difference in the wings of the profile would otherwise be
+    dominated by roundoff.
+    """
+    inv_s2dw = 1.0 / (SQRT2 * sigma)
+
+    # Pixel edges in units of sqrt(2) * sigma
+    arg_l = (x - mu - 0.5 * xdx) * inv_s2dw
+    arg_r = arg_l + xdx * inv_s2dw
+
+    return (_erf_wings(arg_r) - _erf_wings(arg_l)) * normalization / (2 * xdx)
+
+
+def _pixel_width(xdx, i):
+    """
+    Width of pixel ``i`` from an array of widths ``xdx`` or a scalar width
+    shared by all pixels.  Specialized at compile time in jitted functions
+    with the overload below.
+    """
+    if np.isscalar(xdx):
+        return xdx
+    else:
+        return xdx[i]
+
+
+@overload(_pixel_width)
+def _pixel_width_overload(xdx, i):
+    if isinstance(xdx, types.Number):
+        return lambda xdx, i: xdx
+    else:
+        return lambda xdx, i: xdx[i]
+
+
+# Tolerance relative to the pixel width for matching the edges of adjacent
+# pixels in _pixel_integrated_gaussian_edges
+PIXEL_EDGE_RTOL = 1.0e-8
+
+
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
+def _add_pixel_integrated_gaussian_edges(
+    x, xdx, mu, sigma, normalization, samp
+):
+    """
+    Add a pixel-integrated gaussian on a 1D grid for scalar ``mu``, ``sigma``
+    and ``normalization`` to ``samp``, with pixel widths ``xdx`` that can be
+    an array or a scalar.  The error function at the right edge of
+    a pixel is reused for the left edge of the next pixel where the two
+    coincide, e.g., on a contiguous grid, which halves the number of
+    evaluations.  See `pixel_integrated_gaussian_numba`.
+    """
+    N = len(x)
+
+    inv_s2dw = 1.0 / (SQRT2 * sigma)
+    scale = 0.5 * normalization
+
+    xr = 0.0
+    erf_r = 0.0
+
+    for i in range(N):
+        dx_i = _pixel_width(xdx, i)
+        xl = x[i] - 0.5 * dx_i
+
+        if (i > 0) and (np.abs(xl - xr) <= PIXEL_EDGE_RTOL * np.abs(dx_i)):
+            erf_l = erf_r
+        else:
+            erf_l = _erf_wings((xl - mu) * inv_s2dw)
+
+        xr = xl + dx_i
+        erf_r = _erf_wings((xr - mu) * inv_s2dw)
+
+        samp[i] += (erf_r - erf_l) * scale / dx_i
+
+
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
+def _pixel_integrated_gaussian_edges(x, xdx, mu, sigma, normalization):
+    """
+    Pixel-integrated gaussian on a 1D grid for scalar ``mu``, ``sigma`` and
+    ``normalization``.  See `_add_pixel_integrated_gaussian_edges`.
+    """
+    samp = np.zeros_like(x)
+    _add_pixel_integrated_gaussian_edges(
+        x, xdx, mu, sigma, normalization, samp
+    )
+    return samp
+
+
+def _pixel_integrated_gaussian(x, xdx, mu, sigma, normalization):
+    """
+    Evaluate the pixel-integrated gaussian with
+    `_pixel_integrated_gaussian_edges` for a 1D grid and scalar parameters,
+    otherwise with the `_pixel_integrated_gaussian_kernel` ufunc.
+    Specialized at compile time in jitted functions with the overload below.
+    """
+    scalar_params = all(np.isscalar(arg) for arg in (mu, sigma, normalization))
+
+    is_grid = (np.ndim(x) == 1) & (x.dtype.kind == "f")
+
+    if is_grid & scalar_params & (np.ndim(xdx) <= 1):
+        return _pixel_integrated_gaussian_edges(
+            x, xdx, mu, sigma, normalization
+        )
+    else:
+        return _pixel_integrated_gaussian_kernel(
+            x, xdx, mu, sigma, normalization
+        )
+
+
+@overload(_pixel_integrated_gaussian)
+def _pixel_integrated_gaussian_overload(x, xdx, mu, sigma, normalization):
+    scalar_params = all(
+        isinstance(arg, types.Number) for arg in (mu, sigma, normalization)
+    )
+
+    is_grid = (
+        isinstance(x, types.Array)
+        and (x.ndim == 1)
+        and isinstance(x.dtype, types.Float)
+    )
+
+    is_width = isinstance(xdx, types.Number) or (
+        isinstance(xdx, types.Array) and (xdx.ndim == 1)
+    )
+
+    if is_grid and scalar_params and is_width:
+        return lambda x, xdx, mu, sigma, normalization: (
+            _pixel_integrated_gaussian_edges(x, xdx, mu, sigma, normalization)
+        )
+
+    return lambda x, xdx, mu, sigma, normalization: (
+        _pixel_integrated_gaussian_kernel(
+            x,
+            _cast_like(xdx, x),
+            _cast_like(mu, x),
+            _cast_like(sigma, x),
+            _cast_like(normalization, x),
+        )
+    )
+
+
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
 def pixel_integrated_gaussian_numba(x, mu, sigma, dx=None, normalization=1.0):
     """
     Low level function for a pixel-integrated gaussian
@@ -332,38 +888,17 @@ def pixel_integrated_gaussian_numba(x, mu, sigma, dx=None, normalization=1.0):
     Returns
     -------
     samp : array-like
-        Pixel-integrated Gaussian
+        Pixel-integrated Gaussian.  Single precision if ``x`` and any array
+        arguments are ``float32``, otherwise double precision.  The error
+        functions at the pixel edges are evaluated with ``math.erf`` in double
+        precision, and taken as +/-1 beyond ``ERF_SATURATE``, where ``erf``
+        already rounds to +/-1.  The result agrees with an exact evaluation to
+        the roundoff of the difference of the two error functions.
 
     """
-    N = len(x)
-    samp = np.zeros_like(x)
-
-    s2dw = np.sqrt(2) * sigma * np.ones_like(x)
-
-    mux = mu * np.ones_like(x)
+    xdx = _pixel_widths(x, dx)
 
-    if dx is None:
-        # Like np.gradient
-        # https://github.com/numba/numba/issues/6302
-        xdx = np.ones_like(x)
-        xdx[1:-1] = (x[2:] - x[:-2]) / 2.0
-        xdx[0] = x[1] - x[0]
-        xdx[-1] = x[-1] - x[-2]
-    else:
-        xdx = dx * np.ones_like(x)
-
-    i = 0
-    x0 = x[i] - mux[i]
-
-    left = erf((x0 - xdx[i] / 2) / s2dw[i])
-    right = erf((x0 + xdx[i] / 2) / s2dw[i])
-    samp[i] = (right - left) / 2 / xdx[i] * normalization
-
-    for i in range(1, N):
-        x0 = x[i] - mux[i]
-        left = erf((x0 - xdx[i] / 2) / s2dw[i])
-        right = erf((x0 + xdx[i] / 2) / s2dw[i])
-        samp[i] = (right - left) / 2 / xdx[i] * normalization
+    samp = _pixel_integrated_gaussian(x, xdx, mu, sigma, normalization)
 
     return samp
 
@@ -439,8 +974,119 @@ def integrate_filter(
     return filter_flux
 
 
-@jit(nopython=True, fastmath=True, error_model="numpy")
-def compute_igm(z, wobs, scale_tau=1.0):
+# Inoue+ (2014) Lyman series coefficients: j, lambda_j, A_LAF_j1, A_LAF_j2,
+# A_LAF_j3
+_LAF = np.array(
+    [
+        [2, 1215.670, 1.68976e-02, 2.35379e-03, 1.02611e-04],
+        [3, 1025.720, 4.69229e-03, 6.53625e-04, 2.84940e-05],
+        [4, 972.537, 2.23898e-03, 3.11884e-04, 1.35962e-05],
+        [5, 949.743, 1.31901e-03, 1.83735e-04, 8.00974e-06],
+        [6, 937.803, 8.70656e-04, 1.21280e-04, 5.28707e-06],
+        [7, 930.748, 6.17843e-04, 8.60640e-05, 3.75186e-06],
+        [8, 926.226, 4.60924e-04, 6.42055e-05, 2.79897e-06],
+        [9, 923.150, 3.56887e-04, 4.97135e-05, 2.16720e-06],
+        [10, 920.963, 2.84278e-04, 3.95992e-05, 1.72628e-06],
+        [11, 919.352, 2.31771e-04, 3.22851e-05, 1.40743e-06],
+        [12, 918.129, 1.92348e-04, 2.67936e-05, 1.16804e-06],
+        [13, 917.181, 1.62155e-04, 2.25878e-05, 9.84689e-07],
+        [14, 916.429, 1.38498e-04, 1.92925e-05, 8.41033e-07],
+        [15, 915.824, 1.19611e-04, 1.66615e-05, 7.26340e-07],
+        [16, 915.329, 1.04314e-04, 1.45306e-05, 6.33446e-07],
+        [17, 914.919, 9.17397e-05, 1.27791e-05, 5.57091e-07],
+        [18, 914.576, 8.12784e-05, 1.13219e-05, 4.93564e-07],
+        [19, 914.286, 7.25069e-05, 1.01000e-05, 4.40299e-07],
+        [20, 914.039, 6.50549e-05, 9.06198e-06, 3.95047e-07],
+        [21, 913.826, 5.86816e-05, 8.17421e-06, 3.56345e-07],
+        [22, 913.641, 5.31918e-05, 7.40949e-06, 3.23008e-07],
+        [23, 913.480, 4.84261e-05, 6.74563e-06, 2.94068e-07],
+        [24, 913.339, 4.42740e-05, 6.16726e-06, 2.68854e-07],
+        [25, 913.215, 4.06311e-05, 5.65981e-06, 2.46733e-07],
+        [26, 913.104, 3.73821e-05, 5.20723e-06, 2.27003e-07],
+        [27, 913.006, 3.45377e-05, 4.81102e-06, 2.09731e-07],
+        [28, 912.918, 3.19891e-05, 4.45601e-06, 1.94255e-07],
+        [29, 912.839, 2.97110e-05, 4.13867e-06, 1.80421e-07],
+        [30, 912.768, 2.76635e-05, 3.85346e-06, 1.67987e-07],
+        [31, 912.703, 2.58178e-05, 3.59636e-06, 1.56779e-07],
+        [32, 912.645, 2.41479e-05, 3.36374e-06, 1.46638e-07],
+        [33, 912.592, 2.26347e-05, 3.15296e-06, 1.37450e-07],
+        [34, 912.543, 2.12567e-05, 2.96100e-06, 1.29081e-07],
+        [35, 912.499, 1.99967e-05, 2.78549e-06, 1.21430e-07],
+        [36, 912.458, 1.88476e-05, 2.62543e-06, 1.14452e-07],
+        [37, 912.420, 1.77928e-05, 2.47850e-06, 1.08047e-07],
+        [38, 912.385, 1.68222e-05, 2.34330e-06, 1.02153e-07],
+        [39, 912.353, 1.59286e-05, 2.21882e-06, 9.67268e-08],
+        [40, 912.324, 1.50996e-05, 2.10334e-06, 9.16925e-08],
+    ]
+).T
+
+# j, lambda_j, A_DLA_j1, A_DLA_j2
+_DLA = np.array(
+    [
+        [2, 1215.670, 1.61698e-04, 5.38995e-05],
+        [3, 1025.720, 1.54539e-04, 5.15129e-05],
+        [4, 972.537, 1.49767e-04, 4.99222e-05],
+        [5, 949.743, 1.46031e-04, 4.86769e-05],
+        [6, 937.803, 1.42893e-04, 4.76312e-05],
+        [7, 930.748, 1.40159e-04, 4.67196e-05],
+        [8, 926.226, 1.37714e-04, 4.59048e-05],
+        [9, 923.150, 1.35495e-04, 4.51650e-05],
+        [10, 920.963, 1.33452e-04, 4.44841e-05],
+        [11, 919.352, 1.31561e-04, 4.38536e-05],
+        [12, 918.129, 1.29785e-04, 4.32617e-05],
+        [13, 917.181, 1.28117e-04, 4.27056e-05],
+        [14, 916.429, 1.26540e-04, 4.21799e-05],
+        [15, 915.824, 1.25041e-04, 4.16804e-05],
+        [16, 915.329, 1.23614e-04, 4.12046e-05],
+        [17, 914.919, 1.22248e-04, 4.07494e-05],
+        [18, 914.576, 1.20938e-04, 4.03127e-05],
+        [19, 914.286, 1.19681e-04, 3.98938e-05],
+        [20, 914.039, 1.18469e-04, 3.94896e-05],
+        [21, 913.826, 1.17298e-04, 3.90995e-05],
+        [22, 913.641, 1.16167e-04, 3.87225e-05],
+        [23, 913.480, 1.15071e-04, 3.83572e-05],
+        [24, 913.339, 1.14011e-04, 3.80037e-05],
+        [25, 913.215, 1.12983e-04, 3.76609e-05],
+        [26, 913.104, 1.11972e-04, 3.73241e-05],
+        [27, 913.006, 1.11002e-04, 3.70005e-05],
+        [28, 912.918, 1.10051e-04, 3.66836e-05],
+        [29, 912.839, 1.09125e-04, 3.63749e-05],
+        [30, 912.768, 1.08220e-04, 3.60734e-05],
+        [31, 912.703, 1.07337e-04, 3.57789e-05],
+        [32, 912.645, 1.06473e-04, 3.54909e-05],
+        [33, 912.592, 1.05629e-04, 3.52096e-05],
+        [34, 912.543, 1.04802e-04, 3.49340e-05],
+        [35, 912.499, 1.03991e-04, 3.46636e-05],
+        [36, 912.458, 1.03198e-04, 3.43994e-05],
+        [37, 912.420, 1.02420e-04, 3.41402e-05],
+        [38, 912.385, 1.01657e-04, 3.38856e-05],
+        [39, 912.353, 1.00908e-04, 3.36359e-05],
+        [40, 912.324, 1.00168e-04, 3.33895e-05],
+    ]
+).T
+
+# Contiguous coefficient arrays, frozen as constants in the compiled
+# compute_igm
+_ALAM = np.ascontiguousarray(_LAF[1])
+_ALAF1 = np.ascontiguousarray(_LAF[2])
+_ALAF2 = np.ascontiguousarray(_LAF[3])
+_ALAF3 = np.ascontiguousarray(_LAF[4])
+
+_ADLA1 = np.ascontiguousarray(_DLA[2])
+_ADLA2 = np.ascontiguousarray(_DLA[3])
+
+_LOG_ALAM = np.log(_ALAM)
+
+
+# Number of wavelengths processed together in the multithreaded IGM kernel,
+# read at runtime by `compute_igm`
+IGM_CHUNK_SIZE = 1024
+
+# Number of wavelengths above which the multithreaded IGM kernel is used
+IGM_PARALLEL_THRESHOLD = 4096
+
+
+def compute_igm(z, wobs, scale_tau=1.0, parallel=None):
     """
     Calculate
     `Inoue+ (2014) <https://ui.adsabs.harvard.edu/abs/2014MNRAS.442.1805I>`_
@@ -457,111 +1103,34 @@ def compute_igm(z, wobs, scale_tau=1.0):
     scale_tau : float
         Scalar multiplied to tau_igm
 
+    parallel : bool, None
+        Use the multithreaded version of the IGM kernel.  If None, use it when
+        ``len(wobs) >= IGM_PARALLEL_THRESHOLD``
+
     Returns
     -------
     igmz : array-like
         IGM transmission factor
     """
+    if parallel is None:
+        parallel = len(wobs) >= IGM_PARALLEL_THRESHOLD
+
+    if parallel:
+        # Chunk size passed as an argument so that it can be changed at
+        # runtime rather than being frozen into the compiled kernel
+        igmz = _compute_igm_parallel(z, wobs, scale_tau, IGM_CHUNK_SIZE)
+    else:
+        igmz = _compute_igm_serial(z, wobs, scale_tau)
+
+    return igmz
 
-    _LAF = np.array(
-        [
-            [2, 1215.670, 1.68976e-02, 2.35379e-03, 1.02611e-04],
-            [3, 1025.720, 4.69229e-03, 6.53625e-04, 2.84940e-05],
-            [4, 972.537, 2.23898e-03, 3.11884e-04, 1.35962e-05],
-            [5, 949.743, 1.31901e-03, 1.83735e-04, 8.00974e-06],
-            [6, 937.803, 8.70656e-04, 1.21280e-04, 5.28707e-06],
-            [7, 930.748, 6.17843e-04, 8.60640e-05, 3.75186e-06],
-            [8, 926.226, 4.60924e-04, 6.42055e-05, 2.79897e-06],
-            [9, 923.150, 3.56887e-04, 4.97135e-05, 2.16720e-06],
-            [10, 920.963, 2.84278e-04, 3.95992e-05, 1.72628e-06],
-            [11, 919.352, 2.31771e-04, 3.22851e-05, 1.40743e-06],
-            [12, 918.129, 1.92348e-04, 2.67936e-05, 1.16804e-06],
-            [13, 917.181, 1.62155e-04, 2.25878e-05, 9.84689e-07],
-            [14, 916.429, 1.38498e-04, 1.92925e-05, 8.41033e-07],
-            [15, 915.824, 1.19611e-04, 1.66615e-05, 7.26340e-07],
-            [16, 915.329, 1.04314e-04, 1.45306e-05, 6.33446e-07],
-            [17, 914.919, 9.17397e-05, 1.27791e-05, 5.57091e-07],
-            [18, 914.576, 8.12784e-05, 1.13219e-05, 4.93564e-07],
-            [19, 914.286, 7.25069e-05, 1.01000e-05, 4.40299e-07],
-            [20, 914.039, 6.50549e-05, 9.06198e-06, 3.95047e-07],
-            [21, 913.826, 5.86816e-05, 8.17421e-06, 3.56345e-07],
-            [22, 913.641, 5.31918e-05, 7.40949e-06, 3.23008e-07],
-            [23, 913.480, 4.84261e-05, 6.74563e-06, 2.94068e-07],
-            [24, 913.339, 4.42740e-05, 6.16726e-06, 2.68854e-07],
-            [25, 913.215, 4.06311e-05, 5.65981e-06, 2.46733e-07],
-            [26, 913.104, 3.73821e-05, 5.20723e-06, 2.27003e-07],
-            [27, 913.006, 3.45377e-05, 4.81102e-06, 2.09731e-07],
-            [28, 912.918, 3.19891e-05, 4.45601e-06, 1.94255e-07],
-            [29, 912.839, 2.97110e-05, 4.13867e-06, 1.80421e-07],
-            [30, 912.768, 2.76635e-05, 3.85346e-06, 1.67987e-07],
-            [31, 912.703, 2.58178e-05, 3.59636e-06, 1.56779e-07],
-            [32, 912.645, 2.41479e-05, 3.36374e-06, 1.46638e-07],
-            [33, 912.592, 2.26347e-05, 3.15296e-06, 1.37450e-07],
-            [34, 912.543, 2.12567e-05, 2.96100e-06, 1.29081e-07],
-            [35, 912.499, 1.99967e-05, 2.78549e-06, 1.21430e-07],
-            [36, 912.458, 1.88476e-05, 2.62543e-06, 1.14452e-07],
-            [37, 912.420, 1.77928e-05, 2.47850e-06, 1.08047e-07],
-            [38, 912.385, 1.68222e-05, 2.34330e-06, 1.02153e-07],
-            [39, 912.353, 1.59286e-05, 2.21882e-06, 9.67268e-08],
-            [40, 912.324, 1.50996e-05, 2.10334e-06, 9.16925e-08],
-        ]
-    ).T
-
-    ALAM = _LAF[1]
-    ALAF1 = _LAF[2]
-    ALAF2 = _LAF[3]
-    ALAF3 = _LAF[4]
-
-    _DLA = np.array(
-        [
-            [2, 1215.670, 1.61698e-04, 5.38995e-05],
-            [3, 1025.720, 1.54539e-04, 5.15129e-05],
-            [4, 972.537, 1.49767e-04, 4.99222e-05],
-            [5, 949.743, 1.46031e-04, 4.86769e-05],
-            [6, 937.803, 1.42893e-04, 4.76312e-05],
-            [7, 930.748, 1.40159e-04, 4.67196e-05],
-            [8, 926.226, 1.37714e-04, 4.59048e-05],
-            [9, 923.150, 1.35495e-04, 4.51650e-05],
-            [10, 920.963, 1.33452e-04, 4.44841e-05],
-            [11, 919.352, 1.31561e-04, 4.38536e-05],
-            [12, 918.129, 1.29785e-04, 4.32617e-05],
-            [13, 917.181, 1.28117e-04, 4.27056e-05],
-            [14, 916.429, 1.26540e-04, 4.21799e-05],
-            [15, 915.824, 1.25041e-04, 4.16804e-05],
-            [16, 915.329, 1.23614e-04, 4.12046e-05],
-            [17, 914.919, 1.22248e-04, 4.07494e-05],
-            [18, 914.576, 1.20938e-04, 4.03127e-05],
-            [19, 914.286, 1.19681e-04, 3.98938e-05],
-            [20, 914.039, 1.18469e-04, 3.94896e-05],
-            [21, 913.826, 1.17298e-04, 3.90995e-05],
-            [22, 913.641, 1.16167e-04, 3.87225e-05],
-            [23, 913.480, 1.15071e-04, 3.83572e-05],
-            [24, 913.339, 1.14011e-04, 3.80037e-05],
-            [25, 913.215, 1.12983e-04, 3.76609e-05],
-            [26, 913.104, 1.11972e-04, 3.73241e-05],
-            [27, 913.006, 1.11002e-04, 3.70005e-05],
-            [28, 912.918, 1.10051e-04, 3.66836e-05],
-            [29, 912.839, 1.09125e-04, 3.63749e-05],
-            [30, 912.768, 1.08220e-04, 3.60734e-05],
-            [31, 912.703, 1.07337e-04, 3.57789e-05],
-            [32, 912.645, 1.06473e-04, 3.54909e-05],
-            [33, 912.592, 1.05629e-04, 3.52096e-05],
-            [34, 912.543, 1.04802e-04, 3.49340e-05],
-            [35, 912.499, 1.03991e-04, 3.46636e-05],
-            [36, 912.458, 1.03198e-04, 3.43994e-05],
-            [37, 912.420, 1.02420e-04, 3.41402e-05],
-            [38, 912.385, 1.01657e-04, 3.38856e-05],
-            [39, 912.353, 1.00908e-04, 3.36359e-05],
-            [40, 912.324, 1.00168e-04, 3.33895e-05],
-        ]
-    ).T
-
-    ADLA1 = _DLA[2]
-    ADLA2 = _DLA[3]
-
-    # def _pow(a, b):
-    #     return a**b
 
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
+def _compute_igm_chunk(z, wobs, i0, i1, tau):
+    """
+    Optical depth kernel of `compute_igm`, which sets ``tau[i0:i1]`` for the
+    wavelengths ``wobs[i0:i1]``
+    """
     ####
     # Lyman series, Lyman-alpha forest
     ####
@@ -578,100 +1147,182 @@ def compute_igm(z, wobs, scale_tau=1.0):
     ###
     lamL = 911.8
 
-    tau = np.zeros_like(wobs)
     zS = z
 
+    log_lamL = np.log(lamL)
+
+    # Line thresholds and powers of (1 + zS) that don't depend on wobs
+    thr_zS = _ALAM * (1 + zS)
+    thr_z1LAF = _ALAM * (1 + z1LAF)
+    thr_z2LAF = _ALAM * (1 + z2LAF)
+    thr_z1DLA = _ALAM * (1 + z1DLA)
+
+    zs1 = 1 + zS
+    zs1_2 = zs1 * zs1
+    zs1_3 = zs1_2 * zs1
+    zs1_pow16 = zs1**1.6
+    zs1_pow23 = zs1**2.3
+    zs1_pow33 = zs1**3.3
+    zs1_pow34 = zs1**3.4
+    zs1_pow_neg09 = zs1 ** (-9e-1)
+
+    wabs = 1300.0 * zs1
+    wlc = lamL * zs1
+
     # Explicit iteration should be fast in JIT
-    for i, wi in enumerate(wobs):
-        if wi > 1300.0 * (1 + zS):
+    for i in range(i0, i1):
+        wi = wobs[i]
+        if wi > wabs:
             continue
 
-        # Iterate over Lyman series
-        for j, lsj in enumerate(ALAM):
+        # One log per wavelength for the non-integer powers below
+        log_wi = np.log(wi)
+
+        # Accumulate in a local, since tau could alias the threshold arrays
+        tau_i = 0.0
+
+        # Iterate over Lyman series.  The thresholds thr_zS decrease with j,
+        # so no more lines contribute once wi is redward of one of them
+        for j, lsj in enumerate(_ALAM):
+            if wi >= thr_zS[j]:
+                break
+
+            # Non-integer powers of R = wi / lsj as exp(k * log(R)), and
+            # products for the integer and half-integer powers
+            lr = log_wi - _LOG_ALAM[j]
+            R = wi / lsj
+            R2 = R * R
+
             # LS LAF
-            if wi < lsj * (1 + zS):
-                if wi < lsj * (1 + z1LAF):
-                    # x1
-                    tau[i] += ALAF1[j] * (wi / lsj) ** 1.2
-                elif (wi >= lsj * (1 + z1LAF)) & (wi < lsj * (1 + z2LAF)):
-                    tau[i] += ALAF2[j] * (wi / lsj) ** 3.7
-                else:
-                    tau[i] += ALAF3[j] * (wi / lsj) ** 5.5
+            if wi < thr_z1LAF[j]:
+                # x1
+                tau_i += _ALAF1[j] * np.exp(1.2 * lr)
+            elif wi < thr_z2LAF[j]:
+                tau_i += _ALAF2[j] * np.exp(3.7 * lr)
+            else:
+                tau_i += _ALAF3[j] * R2 * R2 * R * np.sqrt(R)
 
             # LS DLA
-            if wi < lsj * (1 + zS):
-                if wi < lsj * (1.0 + z1DLA):
-                    tau[i] += ADLA1[j] * (wi / lsj) ** 2
-                else:
-                    tau[i] += ADLA2[j] * (wi / lsj) ** 3
+            if wi < thr_z1DLA[j]:
+                tau_i += _ADLA1[j] * R2
+            else:
+                tau_i += _ADLA2[j] * R2 * R
 
         # Lyman Continuum
-        if wi < lamL * (1 + zS):
+        if wi < wlc:
+            # Non-integer powers of wi / lamL shared by the branches below,
+            # as exp(k * log(wi / lamL))
+            lrL = log_wi - log_lamL
+            r_m03 = np.exp(-0.3 * lrL)
+            r_12 = np.exp(1.2 * lrL)
+            r_21 = np.exp(2.1 * lrL)
+
+            # Integer and half-integer powers as products
+            r = wi / lamL
+            r2 = r * r
+
             # LC DLA
             if zS < z1DLA:
-                tau[i] += (
-                    0.2113 * _pow(1 + zS, 2)
-                    - 0.07661 * _pow(1 + zS, 2.3) * _pow(wi / lamL, (-3e-1))
-                    - 0.1347 * _pow(wi / lamL, 2)
+                tau_i += (
+                    0.2113 * zs1_2 - 0.07661 * zs1_pow23 * r_m03 - 0.1347 * r2
                 )
             else:
                 x1 = wi >= lamL * (1 + z1DLA)
                 if wi >= lamL * (1 + z1DLA):
-                    tau[i] += (
-                        0.04696 * _pow(1 + zS, 3)
-                        - 0.01779
-                        * _pow(1 + zS, 3.3)
-                        * _pow(wi / lamL, (-3e-1))
-                        - 0.02916 * _pow(wi / lamL, 3)
+                    tau_i += (
+                        0.04696 * zs1_3
+                        - 0.01779 * zs1_pow33 * r_m03
+                        - 0.02916 * r2 * r
                     )
                 else:
-                    tau[i] += (
+                    tau_i += (
                         0.6340
-                        + 0.04696 * _pow(1 + zS, 3)
-                        - 0.01779
-                        * _pow(1 + zS, 3.3)
-                        * _pow(wi / lamL, (-3e-1))
-                        - 0.1347 * _pow(wi / lamL, 2)
-                        - 0.2905 * _pow(wi / lamL, (-3e-1))
+                        + 0.04696 * zs1_3
+                        - 0.01779 * zs1_pow33 * r_m03
+                        - 0.1347 * r2
+                        - 0.2905 * r_m03
                     )
 
             # LC LAF
             if zS < z1LAF:
-                tau[i] += 0.3248 * (
-                    _pow(wi / lamL, 1.2)
-                    - _pow(1 + zS, -9e-1) * _pow(wi / lamL, 2.1)
-                )
+                tau_i += 0.3248 * (r_12 - zs1_pow_neg09 * r_21)
             elif zS < z2LAF:
                 if wi >= lamL * (1 + z1LAF):
-                    tau[i] += 2.545e-2 * (
-                        _pow(1 + zS, 1.6) * _pow(wi / lamL, 2.1)
-                        - _pow(wi / lamL, 3.7)
-                    )
+                    tau_i += 2.545e-2 * (zs1_pow16 * r_21 - np.exp(3.7 * lrL))
                 else:
-                    tau[i] += (
-                        2.545e-2 * _pow(1 + zS, 1.6) * _pow(wi / lamL, 2.1)
-                        + 0.3248 * _pow(wi / lamL, 1.2)
-                        - 0.2496 * _pow(wi / lamL, 2.1)
+                    tau_i += (
+                        2.545e-2 * zs1_pow16 * r_21
+                        + 0.3248 * r_12
+                        - 0.2496 * r_21
                     )
             else:
                 if wi > lamL * (1.0 + z2LAF):
-                    tau[i] += 5.221e-4 * (
-                        _pow(1 + zS, 3.4) * _pow(wi / lamL, 2.1)
-                        - _pow(wi / lamL, 5.5)
+                    tau_i += 5.221e-4 * (
+                        zs1_pow34 * r_21 - r2 * r2 * r * np.sqrt(r)
                     )
                 elif (wi >= lamL * (1 + z1LAF)) & (wi < lamL * (1 + z2LAF)):
-                    tau[i] += (
-                        5.221e-4 * _pow(1 + zS, 3.4) * _pow(wi / lamL, 2.1)
-                        + 0.2182 * _pow(wi / lamL, 2.1)
-                        - 2.545e-2 * _pow(wi / lamL, 3.7)
+                    tau_i += (
+                        5.221e-4 * zs1_pow34 * r_21
+                        + 0.2182 * r_21
+                        - 2.545e-2 * np.exp(3.7 * lrL)
                     )
                 elif wi < lamL * (1 + z1LAF):
-                    tau[i] += (
-                        5.221e-4 * _pow(1 + zS, 3.4) * _pow(wi / lamL, 2.1)
-                        + 0.3248 * _pow(wi / lamL, 1.2)
-                        - 3.140e-2 * _pow(wi / lamL, 2.1)
+                    tau_i += (
+                        5.221e-4 * zs1_pow34 * r_21
+                        + 0.3248 * r_12
+                        - 3.140e-2 * r_21
                     )
 
+        tau[i] = tau_i
+
+
+@jit(nopython=True, fastmath=True, error_model="numpy", cache=True)
+def _compute_igm_serial(z, wobs, scale_tau):
+    """
+    Serial IGM kernel of `compute_igm`
+    """
+    # Only wavelengths blueward of 1300 A rest-frame are absorbed, so skip
+    # everything below if none of them are
+    if (len(wobs) == 0) or (wobs.min() > 1300.0 * (1 + z)):
+        return np.ones(wobs.shape)
+
+    tau = np.zeros(wobs.shape)
+
+    _compute_igm_chunk(z, wobs, 0, len(wobs), tau)
+
+    igmz = np.exp(-scale_tau * tau)
+
+    return igmz
+
+
+@jit(
+    nopython=True,
+    parallel=True,
+    fastmath=True,
+    error_model="numpy",
+    cache=True,
+)
+def _compute_igm_parallel(z, wobs, scale_tau, chunk_size):
+    """
+    Multithreaded IGM kernel of `compute_igm`, where the wavelengths are
+    processed in independent chunks of ``chunk_size``
+    """
+    # Only wavelengths blueward of 1300 A rest-frame are absorbed, so skip
+    # everything below if none of them are
+    if (len(wobs) == 0) or (wobs.min() > 1300.0 * (1 + z)):
+        return np.ones(wobs.shape)
+
+    tau = np.zeros(wobs.shape)
+
+    N = len(wobs)
+
+    nchunk = (N + chunk_size - 1) // chunk_size
+
+    for k in prange(nchunk):
+        i0 = k * chunk_size
+        i1 = min(i0 + chunk_size, N)
+        _compute_igm_chunk(z, wobs, i0, i1, tau)
+
     igmz = np.exp(-scale_tau * tau)
 
     return igmz
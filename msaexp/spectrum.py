@@ -2458,6 +2458,7 @@ def plot_spectrum(
     return_fit_results=False,
     use_aper_columns=False,
     label=None,
+    make_figure=True,
     **kwargs,
 ):
     """
@@ -2527,6 +2528,10 @@ def plot_spectrum(
     label : None or str, optional
         Label to add to the figure. Default is None.
 
+    make_figure : bool, optional
+        Make the diagnostic figure.  If False, skip the plotting and return
+        ``None`` for the figure. Default is True.
+
     kwargs : dict, optional
         Additional keyword arguments passed to `~msaexp.spectrum.SpectrumSampler`
         and  `~msaexp.spectrum.make_templates`
@@ -2535,7 +2540,8 @@ def plot_spectrum(
     -------
     If ``return_fit_results = True``, returns a tuple containing the fit results:
     ``templates, coeffs, flam, eflam, _model, mask, full_chi2``.
-    Otherwise, returns ``None``.
+    Otherwise, returns ``fig, spec, data`` with the figure (``None`` if
+    ``make_figure = False``), the spectrum table and the fit results.
 
     """
     global SCALE_UNCERTAINTY
@@ -2731,6 +2737,9 @@ def plot_spectrum(
     for k in ["z", "wmin", "wmax", "dof", "fullchi2", "contchi2"]:
         spec.meta[k] = data[k]
 
+    if not make_figure:
+        return None, spec, data
+
     # fig, axes = plt.subplots(len(ranges)+1,1,figsize=figsize)
     if len(ranges) > 0:
         fig = plt.figure(figsize=figsize, constrained_layout=True)
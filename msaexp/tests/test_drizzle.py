@@ -114,12 +114,9 @@ def test_combine():
 
     outhdu.writeto(file, overwrite=True)
 
-    # Make figures
+    # Plotting smoke test
     fig = utils.drizzled_hdu_figure(outhdu, unit="fnu")
-    fig.savefig(f"{outroot}-{grating}_{target}.fnu.png")
-
-    fig = utils.drizzled_hdu_figure(outhdu, unit="flam")
-    fig.savefig(f"{outroot}-{grating}_{target}.flam.png")
+    assert len(fig.axes) > 0
 
     plt.close("all")
 
@@ -267,13 +264,6 @@ def test_drizzle_combine_slits():
 
     outhdu.writeto(file, overwrite=True)
 
-    # Make figures
-    fig = utils.drizzled_hdu_figure(outhdu, unit="fnu")
-    fig.savefig(f"{outroot}-{grating}_{target}.fnu.png")
-
-    fig = utils.drizzled_hdu_figure(outhdu, unit="flam")
-    fig.savefig(f"{outroot}-{grating}_{target}.flam.png")
-
     plt.close("all")
 
     # #########
@@ -46,6 +46,26 @@ def test_igm():
     igmz = compute_igm(10, wobs, scale_tau=1.0)
     assert np.allclose(igmz, 0.0, rtol=1.0e-6)
 
+    # Serial and multithreaded versions, with chunks that don't divide the
+    # number of wavelengths
+    wobs = np.linspace(0.2, 1.0, 5000) * 1.0e4
+    res = {}
+    for parallel in [False, True]:
+        res[parallel] = compute_igm(6.0, wobs, parallel=parallel)
+
+    assert np.allclose(res[False], res[True], rtol=1.0e-12)
+
+
+def test_erf_wings():
+    """
+    Test error function with saturated wings
+    """
+    from math import erf
+    from ..resample_numba import _erf_wings
+
+    for xi in [-30.0, -6.5, -2.0, 0.0, 0.3, 5.9, 6.1, 1.0e3]:
+        assert _erf_wings(xi) == erf(xi)
+
 
 def test_prf():
     """
@@ -77,6 +97,15 @@ def test_prf():
             prf = pixel_integrated_gaussian_numba(x, mu, sigma, dx=None)
             assert np.allclose(prf.sum(), 1.0)
 
+    # Scalar parameters reuse the shared pixel edges, same as for arrays
+    for x in [np.arange(-64, 65, dtype=float), np.logspace(-1, 1, 128) - 3]:
+        for dx in [None, 0.5]:
+            prf = pixel_integrated_gaussian_numba(x, -1.8, 0.4, dx=dx)
+            prf_arr = pixel_integrated_gaussian_numba(
+                x, np.full_like(x, -1.8), 0.4, dx=dx
+            )
+            assert np.allclose(prf, prf_arr, rtol=1.0e-6, atol=1.0e-12)
+
     ##########
     # 2D
     sh = (32, 32)
@@ -107,6 +136,130 @@ def test_prf():
     assert np.allclose(prf_mu.reshape(sh).sum(axis=0), 1.0)
 
 
+def test_resample_template():
+    """
+    Test resampling a template with a Gaussian kernel
+    """
+    from ..resample_numba import resample_template_numba
+
+    templ_wobs = np.linspace(1.0, 5.0, 20000)
+    spec_wobs = np.linspace(1.0, 5.0, 512)
+    spec_R_fwhm = np.full_like(spec_wobs, 300.0)
+
+    # Constant template, including the first pixel where only half of the
+    # kernel is covered by the template
+    res = resample_template_numba(
+        spec_wobs,
+        spec_R_fwhm,
+        templ_wobs,
+        np.ones_like(templ_wobs),
+        velocity_sigma=100,
+    )
+    assert np.allclose(res[4:-4], 1.0, rtol=1.0e-4)
+    assert np.allclose(res[[0, -1]], 0.5, rtol=1.0e-2)
+
+    # Linear template preserved by a symmetric kernel
+    res = resample_template_numba(
+        spec_wobs[4:-4],
+        spec_R_fwhm[4:-4],
+        templ_wobs,
+        templ_wobs,
+        velocity_sigma=100,
+    )
+    assert np.allclose(res, spec_wobs[4:-4], rtol=1.0e-4)
+
+    # Fill values
+    res = resample_template_numba(
+        spec_wobs,
+        spec_R_fwhm,
+        templ_wobs[:10000],
+        np.ones(10000),
+        velocity_sigma=100,
+        fill_value=-1.0,
+        wave_min=1.5,
+        left=-2.0,
+    )
+    assert np.allclose(res[spec_wobs < 1.5], -2.0)
+    assert np.allclose(res[spec_wobs > 3.1], -1.0)
+
+    # Zero kernel width takes the nearest template sample
+    res = resample_template_numba(
+        spec_wobs[4:-4],
+        np.full(len(spec_wobs) - 8, np.inf),
+        templ_wobs,
+        templ_wobs,
+        velocity_sigma=0.0,
+    )
+    assert np.all(np.isfinite(res))
+    assert np.allclose(res, spec_wobs[4:-4], atol=np.diff(templ_wobs)[0] / 2)
+
+    res = resample_template_numba(
+        np.array([1.1, 1.9]),
+        np.full(2, np.inf),
+        np.arange(4.0),
+        np.arange(4.0),
+        velocity_sigma=0.0,
+    )
+    assert np.allclose(res, [1.0, 2.0])
+
+    # Serial and multithreaded versions, with a resolution jump that moves
+    # the kernel edges backwards
+    spec_wobs = np.linspace(1.0, 5.0, 5000)
+    spec_R_fwhm = np.where(spec_wobs > 3, 1000.0, 100.0)
+    templ_flux = np.sin(templ_wobs * 20)
+    res = {}
+    for parallel in [False, True]:
+        res[parallel] = resample_template_numba(
+            spec_wobs,
+            spec_R_fwhm,
+            templ_wobs,
+            templ_flux,
+            velocity_sigma=100,
+            parallel=parallel,
+        )
+
+    assert np.allclose(res[False], res[True], rtol=1.0e-10)
+
+
+def test_float32():
+    """
+    Test single precision versions of the resampling and PRF functions
+    """
+    from ..resample_numba import (
+        resample_template_numba,
+        pixel_integrated_gaussian_numba,
+    )
+
+    spec_wobs = np.linspace(1.0, 5.0, 512)
+    spec_R_fwhm = np.full_like(spec_wobs, 300.0)
+    templ_wobs = np.linspace(0.5, 6.0, 4096)
+    templ_flux = np.sin(templ_wobs * 20) + 2.0
+
+    res = resample_template_numba(
+        spec_wobs, spec_R_fwhm, templ_wobs, templ_flux
+    )
+
+    f32 = [a.astype(np.float32) for a in [spec_wobs, spec_R_fwhm]]
+    res32 = resample_template_numba(
+        *f32, templ_wobs.astype(np.float32), templ_flux.astype(np.float32)
+    )
+    assert res32.dtype == np.float32
+    assert np.allclose(res32, res, rtol=1.0e-5)
+
+    # Double precision unless the template is also float32
+    res_mix = resample_template_numba(*f32, templ_wobs, templ_flux)
+    assert res_mix.dtype == np.float64
+
+    x = np.arange(-64, 65, dtype=float)
+    prf = pixel_integrated_gaussian_numba(x, 0.3, 1.2, dx=None)
+
+    prf32 = pixel_integrated_gaussian_numba(
+        x.astype(np.float32), 0.3, 1.2, dx=None
+    )
+    assert prf32.dtype == np.float32
+    assert np.allclose(prf32, prf, rtol=1.0e-5, atol=1.0e-12)
+
+
 def test_prf_line():
     """
     Test pixel-integrated emission line model
@@ -237,3 +390,35 @@ def test_dust_models():
 
     A_smc = smc_alambda(wrest * (1 + z), z)
     assert np.allclose(A_smc, [7.93700997, 3.13109021, 1.0, 0.0], rtol=1.0e-3)
+
+
+def test_prf_lines():
+    """
+    Test batched emission line models
+    """
+    from ..resample_numba import (
+        sample_gaussian_line_numba,
+        sample_gaussian_lines_numba,
+    )
+
+    spec_wobs = np.logspace(np.log10(0.6), np.log10(5.3), 1024)
+    spec_R_fwhm = 100 + 50 * spec_wobs
+    lines_um = np.array([0.6563, 1.5, 3.2, 3.2001, 5.0])
+    line_flux = np.array([1.0, 2.0, 0.5, 0.5, 3.0])
+
+    lines = sample_gaussian_lines_numba(
+        spec_wobs, spec_R_fwhm, lines_um, line_flux, velocity_sigma=200.0
+    )
+
+    line_sum = np.zeros_like(spec_wobs)
+    for line_um, flux in zip(lines_um, line_flux):
+        line_sum += sample_gaussian_line_numba(
+            spec_wobs,
+            spec_R_fwhm,
+            line_um,
+            line_flux=flux,
+            velocity_sigma=200.0,
+        )
+
+    assert np.allclose(lines, line_sum)
+    assert np.allclose(np.trapz(lines, spec_wobs), line_flux.sum(), rtol=1e-3)